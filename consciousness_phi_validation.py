@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Consciousness Detection Validation - Φ-Based Framework Benchmark
+Validates the IIT-inspired Φ approximation against labelled synthetic systems
+"""
+
+import numpy as np
+
+
+class PhiConsciousnessDetector:
+    """
+    Approximate integrated information (Φ) detector for small systems.
+    Uses Monte-Carlo partition sampling instead of the exponential exact search.
+    """
+
+    def __init__(self, phi_threshold=0.75, num_samples=64, seed=42):
+        self.phi_threshold = phi_threshold  # Φ level treated as "conscious"
+        self.num_samples = num_samples      # Sampled partitions per system
+        self.rng = np.random.default_rng(seed)
+
+    def _approximate_phi(self, connectivity: np.ndarray) -> float:
+        """
+        Monte-Carlo approximation of Φ via random 4-way partitions.
+        Φ is taken as the minimum cross-partition integration over samples.
+        """
+        n = connectivity.shape[0]
+        total_weight = connectivity.sum()
+        if total_weight <= 0.0:
+            return 0.0
+
+        min_integration = np.inf
+        mask = np.ones(n, dtype=bool)  # Tracks nodes not yet assigned to a part
+
+        for _ in range(self.num_samples):
+            # Draw three random subsets; whatever is left forms the fourth part
+            mask[:] = True
+            parts = []
+            for _ in range(3):
+                size = max(1, n // 4)
+                subset = self.rng.choice(np.flatnonzero(mask), size=size, replace=False)
+                mask[subset] = False
+                parts.append(subset)
+            remaining = np.flatnonzero(mask)
+            if remaining.size:
+                parts.append(remaining)
+
+            # Integration = connectivity weight crossing partition boundaries
+            cross_weight = 0.0
+            for i in range(len(parts)):
+                for j in range(len(parts)):
+                    if i != j:
+                        cross_weight += connectivity[np.ix_(parts[i], parts[j])].sum()
+
+            integration = cross_weight / total_weight
+            if integration < min_integration:
+                min_integration = integration
+
+        return float(min_integration)
+
+    def compute_phi(self, connectivity: np.ndarray) -> float:
+        """Public Φ estimate for a system's connectivity matrix."""
+        return self._approximate_phi(np.asarray(connectivity, dtype=np.float64))
+
+
+def generate_test_systems(num_systems=40, n=12, seed=7):
+    """
+    Generate labelled synthetic systems for validation.
+    "Conscious" systems get dense, recurrent connectivity; controls get
+    sparse, feed-forward-like connectivity with the same weight scale.
+    """
+    rng = np.random.default_rng(seed)
+    systems = []
+
+    for k in range(num_systems):
+        conscious = k % 2 == 0
+        if conscious:
+            # Dense recurrent coupling - high integration across any partition
+            connectivity = rng.random((n, n)) * 0.8 + 0.2
+        else:
+            # Mostly modular coupling - weak integration between modules
+            connectivity = rng.random((n, n)) * 0.1
+            half = n // 2
+            connectivity[:half, :half] += rng.random((half, half)) * 0.8
+            connectivity[half:, half:] += rng.random((n - half, n - half)) * 0.8
+        np.fill_diagonal(connectivity, 0.0)
+        systems.append((connectivity, conscious))
+
+    return systems
+
+
+def validate_framework(test_systems, detector=None):
+    """
+    Validate the Φ detector against labelled systems.
+
+    Computes the confusion matrix with a single bincount and derives
+    accuracy/precision/recall/F1 analytically from its four counts, and
+    builds the ROC curve with one descending sort of the Φ scores.
+    """
+    if detector is None:
+        detector = PhiConsciousnessDetector()
+
+    num_systems = len(test_systems)
+    phi_values = np.empty(num_systems, dtype=np.float64)
+    labels = np.empty(num_systems, dtype=np.int64)
+
+    for idx, (connectivity, is_conscious) in enumerate(test_systems):
+        phi_values[idx] = detector.compute_phi(connectivity)
+        labels[idx] = 1 if is_conscious else 0
+
+    # Confusion matrix in one bincount: code = 2*label + prediction
+    predictions = (phi_values >= detector.phi_threshold).astype(np.int64)
+    counts = np.bincount(2 * labels + predictions, minlength=4)
+    tn, fp, fn, tp = counts
+
+    accuracy = (tp + tn) / num_systems
+    precision = tp / (tp + fp) if (tp + fp) > 0 else 0.0
+    recall = tp / (tp + fn) if (tp + fn) > 0 else 0.0
+    f1 = 2 * precision * recall / (precision + recall) if (precision + recall) > 0 else 0.0
+
+    # ROC via a single descending sort of Φ scores
+    order = np.argsort(-phi_values)
+    sorted_labels = labels[order]
+    num_positive = tp + fn
+    num_negative = tn + fp
+    true_positive_curve = np.cumsum(sorted_labels)
+    false_positive_curve = np.cumsum(1 - sorted_labels)
+    tpr = np.concatenate(([0.0], true_positive_curve / max(num_positive, 1)))
+    fpr = np.concatenate(([0.0], false_positive_curve / max(num_negative, 1)))
+    auc = float(np.trapezoid(tpr, fpr))
+
+    return {
+        "phi_values": phi_values,
+        "labels": labels,
+        "confusion_matrix": (int(tn), int(fp), int(fn), int(tp)),
+        "accuracy": float(accuracy),
+        "precision": float(precision),
+        "recall": float(recall),
+        "f1": float(f1),
+        "fpr": fpr,
+        "tpr": tpr,
+        "auc": auc,
+    }
+
+
+def main():
+    """Run the Φ detection validation benchmark"""
+    print("🧠 CONSCIOUSNESS DETECTION VALIDATION - Φ FRAMEWORK")
+    print("=" * 60)
+
+    test_systems = generate_test_systems()
+    results = validate_framework(test_systems)
+
+    tn, fp, fn, tp = results["confusion_matrix"]
+    print(f"\n📊 Systems evaluated: {len(test_systems)}")
+    print(f"   • Confusion matrix: TP={tp}, FP={fp}, FN={fn}, TN={tn}")
+    print(f"   • Accuracy:  {results['accuracy']:.3f}")
+    print(f"   • Precision: {results['precision']:.3f}")
+    print(f"   • Recall:    {results['recall']:.3f}")
+    print(f"   • F1 Score:  {results['f1']:.3f}")
+    print(f"   • ROC AUC:   {results['auc']:.3f}")
+
+    if results["auc"] >= 0.9:
+        print("\n🎉 Φ detector cleanly separates integrated from modular systems!")
+    else:
+        print("\n⚠️  Φ detector separation below target - review threshold")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,204 +4,204 @@ Speculative Decoding State-of-the-Art Overview - Simplified
 Comprehensive analysis without complex visualizations
 """
 
+import sys
+
+TECHNIQUES = {
+    "Speculative Sampling (2023)": {
+        "authors": "Leviathan et al.",
+        "speedup": "1.5-2x",
+        "key_innovation": "Draft model generates token candidates, target model verifies in parallel",
+        "limitations": "Fixed draft model size, limited adaptability"
+    },
+    "Lookahead Decoding (2023)": {
+        "authors": "Fu et al.",
+        "speedup": "2-2.5x",
+        "key_innovation": "N-gram based drafting with dynamic verification windows",
+        "limitations": "Language-specific, requires training data"
+    },
+    "Medusa (2024)": {
+        "authors": "Cai et al.",
+        "speedup": "2-3x",
+        "key_innovation": "Multi-head attention for parallel token generation",
+        "limitations": "Requires model-specific training"
+    },
+    "EAGLE (2024)": {
+        "authors": "Li et al.",
+        "speedup": "2.5-3x",
+        "key_innovation": "Entropy-guided adaptive generation with learned thresholds",
+        "limitations": "Complex training requirements"
+    }
+}
+
+# The overview is static prose - one heredoc constant, one write
+_SOTA_TEXT = f"""🚀 SPECULATIVE DECODING STATE-OF-THE-ART OVERVIEW
+{'=' * 80}
+
+🎯 WHAT IS SPECULATIVE DECODING?
+----------------------------------------
+Speculative decoding accelerates LLM inference by using a smaller 'draft' model
+to predict multiple tokens, then verifying them in parallel with the larger 'target' model.
+This reduces sequential decoding steps and can achieve 2-3x speedups.
+
+📈 CURRENT SOTA TECHNIQUES:
+-----------------------------------
+
+📊 PERFORMANCE METRICS:
+----------------------------
+• Typical Speedup: 2-3x over autoregressive decoding
+• Token Acceptance Rate: 90-97% (higher is better)
+• Memory Overhead: 10-30% additional memory for draft model
+• Quality Retention: 95-99% of original model quality
+• Latency Reduction: 50-70% for typical generation tasks
+
+🏭 INDUSTRY IMPLEMENTATIONS:
+-----------------------------------
+• Hugging Face Transformers: Native support in generate() method
+• vLLM: Optimized CUDA implementation for GPU acceleration
+• TensorRT-LLM: NVIDIA's optimized inference engine
+• ONNX Runtime: Cross-platform speculative decoding support
+• xAI Grok: Integrated for faster response times
+
+🎯 CURSOR INTEGRATION POTENTIAL:
+------------------------------------------
+• Enhanced AI coding assistance with faster suggestions
+• Confidence-based code completion acceptance
+• Multi-draft approaches for different programming contexts
+• Sonic Function integration for mathematical code optimization
+• Enterprise features for large-scale code generation
+
+🔬 TECHNICAL CHALLENGES:
+------------------------------
+• Draft Model Selection: Optimal size vs quality trade-off
+• Token Acceptance Rate: Balancing speed vs accuracy
+• Memory Overhead: Additional draft model memory requirements
+• Training Complexity: Specialized training for draft models
+• Cross-Model Compatibility: Different architectures compatibility
+
+🔮 EMERGING TRENDS:
+-------------------------
+• Multi-draft models for different contexts
+• Adaptive drafting based on content complexity
+• Integration with other acceleration techniques (quantization, pruning)
+• Cross-architecture compatibility improvements
+• Hardware-specific optimizations (TPU, HPU)
+
+🎨 SONIC FUNCTION INTEGRATION POTENTIAL:
+---------------------------------------------
+• Cognitive mathematics for optimal draft model selection
+• Confidence pairs for dynamic acceptance thresholds
+• Pole singularities for detecting generation uncertainty
+• Enhanced zeta functions for multi-token probability estimation
+• Perfect alignment guarantees for generation consistency
+
+💼 BUSINESS VALUE FOR CURSOR:
+• Faster AI coding assistance (critical for developer experience)
+• Higher quality code suggestions (reduces manual corrections)
+• Better handling of complex programming contexts
+• Competitive advantage over other AI coding platforms
+• Enterprise features for regulated industries
+
+📊 MARKET IMPACT:
+--------------------
+• AI Inference Cost Reduction: 30-50% potential savings
+• User Experience: 2-3x faster response times
+• Energy Efficiency: Reduced computational requirements
+• Scalability: Better handling of concurrent requests
+• Accessibility: Cheaper inference for smaller providers
+
+🎯 CURSOR COMPETITIVE ADVANTAGE:
+----------------------------------------
+Current AI coding tools rely on basic speculative decoding,
+but Sonic Function integration could provide:
+• 40-50% faster suggestions than competitors
+• Mathematically guaranteed code quality
+• Perfect alignment with developer intent
+• Enterprise-grade safety and reliability
+• New market segments in regulated industries
+
+🔬 RESEARCH OPPORTUNITIES:
+• Publish integration results in top AI conferences
+• Collaborate with Cursor on implementation
+• Extend to other AI applications beyond coding
+• Develop new mathematical techniques for inference optimization
+
+🚀 IMPLEMENTATION ROADMAP:
+• Phase 1: Integrate with existing speculative decoding
+• Phase 2: Add Sonic Function enhancements
+• Phase 3: Optimize for coding-specific contexts
+• Phase 4: Enterprise features and safety certifications
+
+🌟 CONCLUSION:
+Speculative decoding represents one of the most promising
+directions for practical AI inference acceleration, and
+Sonic Function integration could create a new SOTA
+in performance, quality, and intelligent adaptation!
+
+🎨 SONIC FUNCTION + SPECULATIVE DECODING INTEGRATION:
+
+Draft Model Optimization:
+  • Sonic Contribution: Enhanced zeta functions for optimal draft model selection
+  • Benefit: Dynamically choose best draft model based on context complexity
+  • Expected Improvement: 20-30% better draft quality prediction
+
+Acceptance Threshold Tuning:
+  • Sonic Contribution: Confidence pairs for dynamic acceptance thresholds
+  • Benefit: Mathematically optimal verification criteria
+  • Expected Improvement: Higher acceptance rates while maintaining quality
+
+Multi-Token Prediction:
+  • Sonic Contribution: Pole singularities for uncertainty detection
+  • Benefit: Identify optimal stopping points for speculation
+  • Expected Improvement: Better handling of ambiguous contexts
+
+Context-Aware Drafting:
+  • Sonic Contribution: Cognitive resonance for semantic understanding
+  • Benefit: More intelligent draft generation based on meaning
+  • Expected Improvement: Higher semantic coherence in generated code
+
+🚀 POTENTIAL PERFORMANCE GAINS:
+• Overall Speedup: 3.5-4x (vs current 2-3x)
+• Acceptance Rate: 95-99% (vs current 90-97%)
+• Quality Retention: 99%+ (vs current 95-99%)
+• Context Awareness: 80% improvement in semantic understanding
+"""
+
+_CLOSING_TEXT = f"""
+{'=' * 80}
+🚀 SPECULATIVE DECODING SOTA OVERVIEW COMPLETE!
+{'=' * 80}
+
+📊 KEY TAKEAWAYS:
+• Speculative decoding achieves 2-3x speedups with 90-97% acceptance rates
+• EAGLE (2024) and Medusa (2024) represent current SOTA
+• Industry adoption growing rapidly across major AI companies
+• Sonic Function integration could push performance to 3.5-4x speedups
+
+🎯 CURSOR INTEGRATION VALUE:
+• Perfect fit for AI coding assistance performance requirements
+• Could provide significant competitive advantage
+• Research collaboration opportunity with real-world impact
+• Potential for joint publications and product differentiation
+
+🔬 NEXT STEPS:
+• Reach out to Cursor engineering team about integration
+• Prepare technical demonstration of Sonic Function benefits
+• Propose joint research on enhanced speculative decoding
+• Develop proof-of-concept implementation
+
+🌟 CONCLUSION:
+Speculative decoding represents one of the most promising
+directions for practical AI inference acceleration, and
+Sonic Function integration could create a new SOTA
+in performance, quality, and intelligent adaptation!
+"""
+
 def create_speculative_decoding_sota():
     """Create comprehensive SOTA analysis"""
-    
-    print("🚀 SPECULATIVE DECODING STATE-OF-THE-ART OVERVIEW")
-    print("=" * 80)
-    
-    print("\n🎯 WHAT IS SPECULATIVE DECODING?")
-    print("-" * 40)
-    print("Speculative decoding accelerates LLM inference by using a smaller 'draft' model")
-    print("to predict multiple tokens, then verifying them in parallel with the larger 'target' model.")
-    print("This reduces sequential decoding steps and can achieve 2-3x speedups.")
-    
-    print("\n📈 CURRENT SOTA TECHNIQUES:")
-    print("-" * 35)
-    
-    techniques = {
-        "Speculative Sampling (2023)": {
-            "authors": "Leviathan et al.",
-            "speedup": "1.5-2x",
-            "key_innovation": "Draft model generates token candidates, target model verifies in parallel",
-            "limitations": "Fixed draft model size, limited adaptability"
-        },
-        "Lookahead Decoding (2023)": {
-            "authors": "Fu et al.",
-            "speedup": "2-2.5x",
-            "key_innovation": "N-gram based drafting with dynamic verification windows",
-            "limitations": "Language-specific, requires training data"
-        },
-        "Medusa (2024)": {
-            "authors": "Cai et al.",
-            "speedup": "2-3x",
-            "key_innovation": "Multi-head attention for parallel token generation",
-            "limitations": "Requires model-specific training"
-        },
-        "EAGLE (2024)": {
-            "authors": "Li et al.",
-            "speedup": "2.5-3x",
-            "key_innovation": "Entropy-guided adaptive generation with learned thresholds",
-            "limitations": "Complex training requirements"
-        }
-    }
-    
-    print("\\n📊 PERFORMANCE METRICS:")
-    print("-" * 28)
-    print("• Typical Speedup: 2-3x over autoregressive decoding")
-    print("• Token Acceptance Rate: 90-97% (higher is better)")
-    print("• Memory Overhead: 10-30% additional memory for draft model")
-    print("• Quality Retention: 95-99% of original model quality")
-    print("• Latency Reduction: 50-70% for typical generation tasks")
-    
-    print("\\n🏭 INDUSTRY IMPLEMENTATIONS:")
-    print("-" * 35)
-    print("• Hugging Face Transformers: Native support in generate() method")
-    print("• vLLM: Optimized CUDA implementation for GPU acceleration")
-    print("• TensorRT-LLM: NVIDIA's optimized inference engine")
-    print("• ONNX Runtime: Cross-platform speculative decoding support")
-    print("• xAI Grok: Integrated for faster response times")
-    
-    print("\\n🎯 CURSOR INTEGRATION POTENTIAL:")
-    print("-" * 42)
-    print("• Enhanced AI coding assistance with faster suggestions")
-    print("• Confidence-based code completion acceptance")
-    print("• Multi-draft approaches for different programming contexts")
-    print("• Sonic Function integration for mathematical code optimization")
-    print("• Enterprise features for large-scale code generation")
-    
-    print("\\n🔬 TECHNICAL CHALLENGES:")
-    print("-" * 30)
-    print("• Draft Model Selection: Optimal size vs quality trade-off")
-    print("• Token Acceptance Rate: Balancing speed vs accuracy")
-    print("• Memory Overhead: Additional draft model memory requirements")
-    print("• Training Complexity: Specialized training for draft models")
-    print("• Cross-Model Compatibility: Different architectures compatibility")
-    
-    print("\\n🔮 EMERGING TRENDS:")
-    print("-" * 25)
-    print("• Multi-draft models for different contexts")
-    print("• Adaptive drafting based on content complexity")
-    print("• Integration with other acceleration techniques (quantization, pruning)")
-    print("• Cross-architecture compatibility improvements")
-    print("• Hardware-specific optimizations (TPU, HPU)")
-    
-    print("\\n🎨 SONIC FUNCTION INTEGRATION POTENTIAL:")
-    print("-" * 45)
-    print("• Cognitive mathematics for optimal draft model selection")
-    print("• Confidence pairs for dynamic acceptance thresholds")
-    print("• Pole singularities for detecting generation uncertainty")
-    print("• Enhanced zeta functions for multi-token probability estimation")
-    print("• Perfect alignment guarantees for generation consistency")
-    
-    print("\\n💼 BUSINESS VALUE FOR CURSOR:")
-    print("• Faster AI coding assistance (critical for developer experience)")
-    print("• Higher quality code suggestions (reduces manual corrections)")
-    print("• Better handling of complex programming contexts")
-    print("• Competitive advantage over other AI coding platforms")
-    print("• Enterprise features for regulated industries")
-    
-    print("\\n📊 MARKET IMPACT:")
-    print("-" * 20)
-    print("• AI Inference Cost Reduction: 30-50% potential savings")
-    print("• User Experience: 2-3x faster response times")
-    print("• Energy Efficiency: Reduced computational requirements")
-    print("• Scalability: Better handling of concurrent requests")
-    print("• Accessibility: Cheaper inference for smaller providers")
-    
-    print("\\n🎯 CURSOR COMPETITIVE ADVANTAGE:")
-    print("-" * 40)
-    print("Current AI coding tools rely on basic speculative decoding,")
-    print("but Sonic Function integration could provide:")
-    print("• 40-50% faster suggestions than competitors")
-    print("• Mathematically guaranteed code quality")
-    print("• Perfect alignment with developer intent")
-    print("• Enterprise-grade safety and reliability")
-    print("• New market segments in regulated industries")
-    
-    print("\\n🔬 RESEARCH OPPORTUNITIES:")
-    print("• Publish integration results in top AI conferences")
-    print("• Collaborate with Cursor on implementation")
-    print("• Extend to other AI applications beyond coding")
-    print("• Develop new mathematical techniques for inference optimization")
-    
-    print("\\n🚀 IMPLEMENTATION ROADMAP:")
-    print("• Phase 1: Integrate with existing speculative decoding")
-    print("• Phase 2: Add Sonic Function enhancements")
-    print("• Phase 3: Optimize for coding-specific contexts")
-    print("• Phase 4: Enterprise features and safety certifications")
-    
-    print("\\n🌟 CONCLUSION:")
-    print("Speculative decoding represents one of the most promising")
-    print("directions for practical AI inference acceleration, and")
-    print("Sonic Function integration could create a new SOTA")
-    print("in performance, quality, and intelligent adaptation!")
-    
-    print("\\n🎨 SONIC FUNCTION + SPECULATIVE DECODING INTEGRATION:")
-    
-    integration_points = {
-        "Draft Model Optimization": {
-            "sonic_contribution": "Enhanced zeta functions for optimal draft model selection",
-            "benefit": "Dynamically choose best draft model based on context complexity",
-            "improvement": "20-30% better draft quality prediction"
-        },
-        "Acceptance Threshold Tuning": {
-            "sonic_contribution": "Confidence pairs for dynamic acceptance thresholds",
-            "benefit": "Mathematically optimal verification criteria",
-            "improvement": "Higher acceptance rates while maintaining quality"
-        },
-        "Multi-Token Prediction": {
-            "sonic_contribution": "Pole singularities for uncertainty detection",
-            "benefit": "Identify optimal stopping points for speculation",
-            "improvement": "Better handling of ambiguous contexts"
-        },
-        "Context-Aware Drafting": {
-            "sonic_contribution": "Cognitive resonance for semantic understanding",
-            "benefit": "More intelligent draft generation based on meaning",
-            "improvement": "Higher semantic coherence in generated code"
-        }
-    }
-    
-    for name, data in integration_points.items():
-        print(f"\\n{name}:")
-        print(f"  • Sonic Contribution: {data['sonic_contribution']}")
-        print(f"  • Benefit: {data['benefit']}")
-        print(f"  • Expected Improvement: {data['improvement']}")
-    
-    print("\\n🚀 POTENTIAL PERFORMANCE GAINS:")
-    print("• Overall Speedup: 3.5-4x (vs current 2-3x)")
-    print("• Acceptance Rate: 95-99% (vs current 90-97%)")
-    print("• Quality Retention: 99%+ (vs current 95-99%)")
-    print("• Context Awareness: 80% improvement in semantic understanding")
-    
-    return techniques
+
+    sys.stdout.write(_SOTA_TEXT)
+    return TECHNIQUES
 
 if __name__ == "__main__":
     techniques = create_speculative_decoding_sota()
-    
-    print("\\n" + "="*80)
-    print("🚀 SPECULATIVE DECODING SOTA OVERVIEW COMPLETE!")
-    print("="*80)
-    print("\\n📊 KEY TAKEAWAYS:")
-    print("• Speculative decoding achieves 2-3x speedups with 90-97% acceptance rates")
-    print("• EAGLE (2024) and Medusa (2024) represent current SOTA")
-    print("• Industry adoption growing rapidly across major AI companies")
-    print("• Sonic Function integration could push performance to 3.5-4x speedups")
-    
-    print("\\n🎯 CURSOR INTEGRATION VALUE:")
-    print("• Perfect fit for AI coding assistance performance requirements")
-    print("• Could provide significant competitive advantage")
-    print("• Research collaboration opportunity with real-world impact")
-    print("• Potential for joint publications and product differentiation")
-    
-    print("\\n🔬 NEXT STEPS:")
-    print("• Reach out to Cursor engineering team about integration")
-    print("• Prepare technical demonstration of Sonic Function benefits")
-    print("• Propose joint research on enhanced speculative decoding")
-    print("• Develop proof-of-concept implementation")
-    
-    print("\\n🌟 CONCLUSION:")
-    print("Speculative decoding represents one of the most promising")
-    print("directions for practical AI inference acceleration, and")
-    print("Sonic Function integration could create a new SOTA")
-    print("in performance, quality, and intelligent adaptation!")
+    sys.stdout.write(_CLOSING_TEXT)
@@ -0,0 +1,380 @@
+#!/usr/bin/env python3
+"""
+Oates Methodology Validation Suite
+Validates the time-evolving hybrid symbolic-neural Ψ(x) system:
+parameter evolution, trajectory physics, and mathematical consistency
+"""
+
+import math
+import time
+from array import array
+from typing import Dict, List
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional - fall back to the interpreted kernel
+    njit = None
+
+try:
+    from joblib import Parallel, delayed
+except ImportError:  # joblib is optional - benchmarks fall back to a serial loop
+    Parallel = None
+
+
+def _identity_decorator(fn):
+    return fn
+
+
+_maybe_njit = (
+    njit(cache=True, fastmath=True, boundscheck=False) if njit is not None else _identity_decorator
+)
+
+# Closures can't use Numba's on-disk cache, so the kernel factory compiles
+# without cache=True
+_maybe_njit_nocache = (
+    njit(fastmath=True, boundscheck=False) if njit is not None else _identity_decorator
+)
+
+
+@_maybe_njit
+def _combine_psi(alpha, S, N, cross, l1, l2, R_cog, R_eff, prior):
+    """
+    Hot arithmetic chain of Ψ(x): hybrid blend × penalty × prior.
+    Only touches scalars, so boundscheck stays off and fastmath lets the
+    exp/multiply chain fuse when Numba is available.
+    """
+    return (alpha * S + (1.0 - alpha) * N + cross) * math.exp(
+        -(l1 * R_cog + l2 * R_eff)
+    ) * prior
+
+
+def make_psi_kernel(l1, l2):
+    """
+    Specialize _combine_psi for fixed λ₁/λ₂ (partial evaluation).
+    With Numba active the closed-over constants become literals the
+    compiler can fold; useful when sweeping many x at one timestep.
+    """
+
+    @_maybe_njit_nocache
+    def kernel(alpha, S, N, cross, R_cog, R_eff, prior):
+        return (alpha * S + (1.0 - alpha) * N + cross) * math.exp(
+            -(l1 * R_cog + l2 * R_eff)
+        ) * prior
+
+    return kernel
+
+
+class HybridDynamicalSystem:
+    """
+    Minimal Ψ(x) system with time-evolving α(t), λ₁(t), λ₂(t) parameters.
+    Mirrors the MECN core equation:
+    Ψ(x) = [α(t)S(x) + (1-α(t))N(x) + cross] × exp(-[λ₁R_cog + λ₂R_eff]) × P(H|E)
+    """
+
+    def __init__(self, num_steps: int = 101, dt: float = 0.1):
+        self.num_steps = num_steps
+        self.dt = dt
+        self.prior_probability = 0.85  # P(H|E) evidence support
+        self.alpha_t: List[float] = []
+        self.lambda1_t: List[float] = []
+        self.lambda2_t: List[float] = []
+        self.generate_parameter_evolution()
+
+    def generate_parameter_evolution(self) -> None:
+        """Evolve α(t), λ₁(t), λ₂(t) over the simulation horizon."""
+        self.alpha_t = []
+        self.lambda1_t = []
+        self.lambda2_t = []
+        self._param_arrays = None  # Invalidate the cached ndarray views
+        # Hoist bound methods out of the loop - no attribute lookup per step
+        alpha_append = self.alpha_t.append
+        l1_append = self.lambda1_t.append
+        l2_append = self.lambda2_t.append
+        exp = math.exp
+        dt = self.dt
+        for i in range(self.num_steps):
+            t = i * dt
+            alpha_append(2.0 * exp(-0.2 * t))
+            l1_append(2.0 * exp(-0.15 * t))
+            l2_append(2.0 * (1.0 - exp(-0.1 * t)))
+
+    @property
+    def parameter_arrays(self):
+        """Lazily cached (α, λ₁, λ₂) ndarrays shared by all consumers."""
+        if self._param_arrays is None:
+            self._param_arrays = (
+                np.asarray(self.alpha_t, dtype=np.float64),
+                np.asarray(self.lambda1_t, dtype=np.float64),
+                np.asarray(self.lambda2_t, dtype=np.float64),
+            )
+        return self._param_arrays
+
+    def generate_trajectory(self) -> List[List[float]]:
+        """Trajectory of (α, λ₁, λ₂) states over time."""
+        return [list(state) for state in zip(self.alpha_t, self.lambda1_t, self.lambda2_t)]
+
+    def symbolic_reasoning(self, x: float) -> float:
+        """Symbolic confidence S(x) - bounded in [0.4, 1.0]."""
+        return 0.4 + 0.6 * math.exp(-0.5 * x * x)
+
+    def neural_processing(self, x: float) -> float:
+        """Neural confidence N(x) - bounded in [0.4, 1.0]."""
+        return 0.4 + 0.6 * math.exp(-abs(x - 1.0))
+
+    def cross_interaction(self, S: float, N: float) -> float:
+        """Symbolic-neural cross-modal interaction term."""
+        return 0.05 * S * N
+
+    def regularization_penalties(self, x: float):
+        """Cognitive and efficiency penalties, each in (0, 1]."""
+        R_cognitive = math.exp(-0.5 * x)
+        R_efficiency = 1.0 / (1.0 + x)
+        return R_cognitive, R_efficiency
+
+    def symbolic_reasoning_vec(self, x: np.ndarray) -> np.ndarray:
+        """Vectorized S(x) over an array of inputs."""
+        return 0.4 + 0.6 * np.exp(-0.5 * x * x)
+
+    def neural_processing_vec(self, x: np.ndarray) -> np.ndarray:
+        """Vectorized N(x) over an array of inputs."""
+        return 0.4 + 0.6 * np.exp(-np.abs(x - 1.0))
+
+    def regularization_penalties_vec(self, x: np.ndarray):
+        """Vectorized (R_cognitive, R_efficiency) over an array of inputs."""
+        return np.exp(-0.5 * x), 1.0 / (1.0 + x)
+
+    def compute_psi(self, x: float, t_idx: int = 0) -> float:
+        """Full Ψ(x) at one timestep."""
+        S = self.symbolic_reasoning(x)
+        N = self.neural_processing(x)
+        cross = self.cross_interaction(S, N)
+        R_cog, R_eff = self.regularization_penalties(x)
+        return _combine_psi(
+            self.alpha_t[t_idx], S, N, cross,
+            self.lambda1_t[t_idx], self.lambda2_t[t_idx],
+            R_cog, R_eff, self.prior_probability,
+        )
+
+    def single_timestep_example(self, x: float = 1.0) -> float:
+        """Benchmark entry point: one full Ψ(x) evaluation."""
+        return self.compute_psi(x, t_idx=0)
+
+
+class ValidationTestSuite:
+    """Validation tests for the hybrid Ψ(x) dynamical system."""
+
+    # Compact status codes - summaries only need counts, not strings
+    PASS, FAIL, ERROR = 0, 1, 2
+
+    def __init__(self, system: HybridDynamicalSystem):
+        self.system = system
+        self.test_names: List[str] = []
+        self.statuses = array('b')  # one signed byte per test
+        self.errors: Dict[str, str] = {}  # messages only for the rare ERROR case
+
+    def run_test(self, test_name: str, test_fn, *args) -> bool:
+        """Run one test, recording a PASS/FAIL/ERROR status code."""
+        try:
+            passed = bool(test_fn(*args))
+            status = self.PASS if passed else self.FAIL
+        except Exception as e:
+            self.errors[test_name] = str(e)
+            status = self.ERROR
+            passed = False
+        self.test_names.append(test_name)
+        self.statuses.append(status)
+        return passed
+
+    @property
+    def test_results(self) -> Dict[str, str]:
+        """Lazily rebuild the legacy name → status-string mapping."""
+        results = {}
+        for name, status in zip(self.test_names, self.statuses):
+            if status == self.PASS:
+                results[name] = "PASS"
+            elif status == self.FAIL:
+                results[name] = "FAIL"
+            else:
+                results[name] = f"ERROR: {self.errors[name]}"
+        return results
+
+    def test_trajectory_bounds(self, a: np.ndarray) -> bool:
+        """All state components must stay within [0, 2]."""
+        # Fast path: two streaming reductions, no mask materialization
+        if float(a.min()) >= 0.0 and float(a.max()) <= 2.0:
+            return True
+        bad = np.argwhere((a < 0.0) | (a > 2.0))
+        if bad.size:
+            i, j = bad[0]
+            print(f"   ❌ Bounds violation at step {i}, component {j}: {a[i, j]:.4f}")
+            return False
+        return True
+
+    def test_trajectory_continuity(self, a: np.ndarray) -> bool:
+        """Adjacent states must not jump by more than 0.5 per component."""
+        d = np.abs(np.diff(a[:, :3], axis=0))
+        if float(d.max()) <= 0.5:
+            return True
+        idx = np.argwhere(d > 0.5)
+        if idx.size:
+            i, j = idx[0]
+            print(f"   ❌ Continuity violation at step {i + 1}, component {j}: Δ={d[i, j]:.4f}")
+            return False
+        return True
+
+    @staticmethod
+    def _window_means(a: np.ndarray) -> tuple:
+        """Mean of the first and last 10 samples (whole series if shorter)."""
+        if a.size < 10:
+            mean = a.mean()
+            return mean, mean
+        return a[:10].mean(), a[-10:].mean()
+
+    def test_alpha_evolution(self) -> bool:
+        """α(t) must decay: early mean above late mean."""
+        alpha_arr, _, _ = self.system.parameter_arrays
+        start_avg, end_avg = self._window_means(alpha_arr)
+        return start_avg > end_avg
+
+    def test_lambda_evolution(self) -> bool:
+        """λ₁(t) decays while λ₂(t) grows toward its asymptote."""
+        _, lambda1_arr, lambda2_arr = self.system.parameter_arrays
+        l1_start, l1_end = self._window_means(lambda1_arr)
+        l2_start, l2_end = self._window_means(lambda2_arr)
+        return l1_start > l1_end and l2_start < l2_end
+
+    def test_mathematical_consistency(self, x: float = 1.0, t_idx: int = 0) -> bool:
+        """Recompute Ψ(x) from components and compare with compute_psi."""
+        system = self.system
+        S = system.symbolic_reasoning(x)
+        N = system.neural_processing(x)
+        cross = system.cross_interaction(S, N)
+        R_cog, R_eff = system.regularization_penalties(x)
+        # λ values are fixed for this timestep - use the specialized kernel
+        kernel = make_psi_kernel(system.lambda1_t[t_idx], system.lambda2_t[t_idx])
+        expected = kernel(
+            system.alpha_t[t_idx], S, N, cross, R_cog, R_eff, system.prior_probability
+        )
+        return abs(expected - system.compute_psi(x, t_idx)) < 1e-12
+
+    _SAMPLE_X = np.array([0.0, 0.5, 1.0, 1.5, 2.0])
+
+    def test_regularization_penalties(self) -> bool:
+        """Penalties must stay in (0, 1] across sample inputs."""
+        R_cog, R_eff = self.system.regularization_penalties_vec(self._SAMPLE_X)
+        return not ((R_cog <= 0.0) | (R_eff <= 0.0) | (R_cog > 1.0) | (R_eff > 1.0)).any()
+
+    def test_physics_informed_constraints(self) -> bool:
+        """S(x) and N(x) confidences must stay in [0.4, 1.0]."""
+        s_values = self.system.symbolic_reasoning_vec(self._SAMPLE_X)
+        n_values = self.system.neural_processing_vec(self._SAMPLE_X)
+        return bool(
+            ((s_values >= 0.4) & (s_values <= 1.0)).all()
+            and ((n_values >= 0.4) & (n_values <= 1.0)).all()
+        )
+
+    def run_comprehensive_validation(self) -> bool:
+        """Run every validation test and report a summary."""
+        print("🧪 OATES METHODOLOGY VALIDATION SUITE")
+        print("=" * 60)
+
+        # Convert once; every trajectory test reuses the same backing array
+        traj_np = np.asarray(self.system.generate_trajectory(), dtype=np.float64)
+
+        self.run_test("trajectory_bounds", self.test_trajectory_bounds, traj_np)
+        self.run_test("trajectory_continuity", self.test_trajectory_continuity, traj_np)
+        self.run_test("alpha_evolution", self.test_alpha_evolution)
+        self.run_test("lambda_evolution", self.test_lambda_evolution)
+        self.run_test("mathematical_consistency", self.test_mathematical_consistency)
+        self.run_test("regularization_penalties", self.test_regularization_penalties)
+        self.run_test("physics_informed_constraints", self.test_physics_informed_constraints)
+
+        passed = self.statuses.count(self.PASS)
+        total = len(self.statuses)
+
+        print(f"\n📊 Results: {passed}/{total} tests passed")
+        for name, status in self.test_results.items():
+            emoji = "✅" if status == "PASS" else "❌"
+            print(f"   {emoji} {name}: {status}")
+
+        return passed == total
+
+    def run_performance_benchmarks(self) -> Dict[str, float]:
+        """Time the core Ψ(x) evaluation paths."""
+        print("\n⚡ PERFORMANCE BENCHMARKS")
+        print("-" * 40)
+
+        benchmarks = {}
+
+        single_timestep = self.system.single_timestep_example
+        # Monotonic nanosecond counter - immune to NTP steps, fine enough
+        # to resolve sub-millisecond kernels
+        start = time.perf_counter_ns()
+        if Parallel is not None:
+            # Independent evaluations; batch 10 calls per task so scheduling
+            # overhead doesn't swamp the sub-millisecond kernel
+            def _batch(count):
+                for _ in range(count):
+                    single_timestep(1.0)
+
+            Parallel(n_jobs=-1, prefer="threads")(delayed(_batch)(10) for _ in range(10))
+        else:
+            for _ in range(100):
+                single_timestep(1.0)
+        benchmarks["single_timestep_x100"] = (time.perf_counter_ns() - start) / 1e9
+
+        start = time.perf_counter_ns()
+        self.system.generate_trajectory()
+        benchmarks["trajectory_generation"] = (time.perf_counter_ns() - start) / 1e9
+
+        for name, elapsed in benchmarks.items():
+            print(f"   • {name}: {elapsed * 1000:.3f} ms")
+
+        return benchmarks
+
+
+def validate_oates_methodologies() -> bool:
+    """Standalone check of the documented α/λ trajectory shapes."""
+    print("\n🔬 OATES METHODOLOGY TRAJECTORY VALIDATION")
+    print("-" * 50)
+
+    t = np.arange(101) * 0.1
+    alpha = 2.0 * np.exp(-0.2 * t)
+    lambda1 = 2.0 * np.exp(-0.15 * t)
+    lambda2 = 2.0 * (1.0 - np.exp(-0.1 * t))
+    trajectory = np.stack([alpha, lambda1, lambda2], axis=1)
+
+    start_state = trajectory[0]
+    end_state = trajectory[-1]
+
+    alpha_decays = start_state[0] > end_state[0]
+    lambda1_decays = start_state[1] > end_state[1]
+    lambda2_grows = start_state[2] < end_state[2]
+
+    print(f"   • α(t): {start_state[0]:.3f} → {end_state[0]:.3f} {'✅' if alpha_decays else '❌'}")
+    print(f"   • λ₁(t): {start_state[1]:.3f} → {end_state[1]:.3f} {'✅' if lambda1_decays else '❌'}")
+    print(f"   • λ₂(t): {start_state[2]:.3f} → {end_state[2]:.3f} {'✅' if lambda2_grows else '❌'}")
+
+    return alpha_decays and lambda1_decays and lambda2_grows
+
+
+def main() -> int:
+    system = HybridDynamicalSystem()
+    suite = ValidationTestSuite(system)
+
+    all_passed = suite.run_comprehensive_validation()
+    suite.run_performance_benchmarks()
+    methodology_valid = validate_oates_methodologies()
+
+    print("\n" + "=" * 60)
+    if all_passed and methodology_valid:
+        print("🎉 ALL VALIDATION CHECKS PASSED")
+        return 0
+    print("⚠️  VALIDATION ISSUES DETECTED - review results above")
+    return 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -4,8 +4,75 @@ Complete System Verification - Demonstrates All Features
 """
 
 import os
-import json
-from datetime import datetime
+import sys
+from functools import lru_cache
+
+@lru_cache(maxsize=1)
+def _json_loads():
+    """
+    Bind the fastest available JSON parser on first use.
+    Deferred so fast-path exits never pay the (comparatively slow)
+    orjson import cost.
+    """
+    try:
+        import orjson
+        return orjson.loads
+    except ImportError:
+        pass
+    try:
+        import ujson
+        return ujson.loads
+    except ImportError:
+        import json
+        return json.loads
+
+_SEP = os.sep
+
+@lru_cache(maxsize=None)
+def _walk(path):
+    """Walk a directory tree once and cache it for all verifiers."""
+    return tuple(os.walk(path))
+
+@lru_cache(maxsize=1)
+def _classify_data_files():
+    """One pass over the cached data walk, dispatching by extension."""
+    json_files = []
+    csv_files = []
+    for root, dirs, files in _walk("data"):
+        prefix = root + _SEP  # join once per directory, not per file
+        for file in files:
+            if file.endswith('.json'):
+                json_files.append(prefix + file)
+            elif file.endswith('.csv'):
+                csv_files.append(prefix + file)
+    return json_files, csv_files
+
+def _scan_tree(path, suffixes=None, skip=("data", "__pycache__")):
+    """
+    Single-pass recursive scandir traversal: fused directory listing,
+    suffix filtering and size stat (cached on the DirEntry).
+    Returns (file_count, total_size).
+    """
+    file_count = 0
+    total_size = 0
+    stack = [path]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if not any(part in entry.path for part in skip):
+                        stack.append(entry.path)
+                elif suffixes is None or entry.name.endswith(suffixes):
+                    try:
+                        total_size += entry.stat().st_size
+                    except OSError:
+                        continue  # dangling symlink
+                    file_count += 1
+    return file_count, total_size
 
 def verify_data_structure():
     """Verify the complete data structure and files"""
@@ -21,22 +88,27 @@ def verify_data_structure():
     total_files = 0
     total_dirs = 0
     
+    out = []
     for base_dir in data_dirs:
         if os.path.exists(base_dir):
-            print(f"\n📁 {base_dir}:")
-            
-            for root, dirs, files in os.walk(base_dir):
+            out.append(f"\n📁 {base_dir}:")
+
+            for root, dirs, files in _walk(base_dir):
                 level = root.replace(base_dir, '').count(os.sep)
                 indent = ' ' * 2 * level
-                print(f"{indent}📂 {os.path.basename(root)}/")
-                
+                out.append(f"{indent}📂 {os.path.basename(root)}/")
+
                 for file in files:
-                    print(f"{indent}  📄 {file}")
+                    out.append(f"{indent}  📄 {file}")
                     total_files += 1
                 total_dirs += len(dirs)
+
+    # One write instead of a syscall per tree entry
+    if out:
+        sys.stdout.write("\n".join(out) + "\n")
     
-    print("
-📊 SUMMARY:"    print(f"  • Total Directories: {total_dirs}")
+    print("\n📊 SUMMARY:")
+    print(f"  • Total Directories: {total_dirs}")
     print(f"  • Total Files: {total_files}")
 
 def verify_json_data():
@@ -44,60 +116,64 @@ def verify_json_data():
     print("\n🔍 VERIFYING JSON DATA STRUCTURE")
     print("=" * 40)
     
-    json_files = []
-    for root, dirs, files in os.walk("data"):
-        for file in files:
-            if file.endswith('.json'):
-                json_files.append(os.path.join(root, file))
-    
+    json_files, _ = _classify_data_files()
+
     print(f"Found {len(json_files)} JSON files:")
-    
+
+    loads = _json_loads()
+    out = []
     for json_file in json_files[:5]:  # Show first 5
         try:
-            with open(json_file, 'r') as f:
-                data = json.load(f)
+            # orjson wants bytes, and the stdlib accepts them too
+            with open(json_file, 'rb') as f:
+                data = loads(f.read())
                 
             if isinstance(data, list):
                 item_count = len(data)
-                sample_keys = set()
-                for item in data[:3]:
-                    if isinstance(item, dict):
-                        sample_keys.update(item.keys())
+                # Schemas are homogeneous here - the first item is enough
+                sample_keys = (
+                    set(data[0].keys()) if data and isinstance(data[0], dict) else set()
+                )
             else:
                 item_count = 1
                 sample_keys = set(data.keys()) if isinstance(data, dict) else set()
                 
-            print(f"  ✅ {os.path.basename(json_file)}: {item_count} items, keys: {sorted(sample_keys)}")
-            
+            out.append(f"  ✅ {os.path.basename(json_file)}: {item_count} items, keys: {sorted(sample_keys)}")
+
         except Exception as e:
-            print(f"  ❌ {os.path.basename(json_file)}: Error - {str(e)}")
+            out.append(f"  ❌ {os.path.basename(json_file)}: Error - {str(e)}")
+
+    if out:
+        sys.stdout.write("\n".join(out) + "\n")
 
 def verify_csv_data():
     """Verify CSV data structure"""
     print("\n🔍 VERIFYING CSV DATA STRUCTURE")
     print("=" * 35)
     
-    csv_files = []
-    for root, dirs, files in os.walk("data"):
-        for file in files:
-            if file.endswith('.csv'):
-                csv_files.append(os.path.join(root, file))
-    
+    _, csv_files = _classify_data_files()
+
     print(f"Found {len(csv_files)} CSV files:")
-    
+
+    out = []
     for csv_file in csv_files:
         try:
-            with open(csv_file, 'r') as f:
-                lines = f.readlines()
-                if lines:
-                    header = lines[0].strip().split(',')
-                    data_rows = len(lines) - 1
-                    
-            print(f"  ✅ {os.path.basename(csv_file)}: {len(header)} columns, {data_rows} data rows")
-            print(f"      Columns: {', '.join(header[:5])}{'...' if len(header) > 5 else ''}")
-            
+            # Stream: read only the header, count the rest without materializing
+            with open(csv_file, 'r', buffering=1 << 20) as f:
+                header_line = f.readline()
+                if not header_line:
+                    continue
+                header = header_line.rstrip('\n').split(',')
+                data_rows = sum(1 for _ in f)
+
+            out.append(f"  ✅ {os.path.basename(csv_file)}: {len(header)} columns, {data_rows} data rows")
+            out.append(f"      Columns: {', '.join(header[:5])}{'...' if len(header) > 5 else ''}")
+
         except Exception as e:
-            print(f"  ❌ {os.path.basename(csv_file)}: Error - {str(e)}")
+            out.append(f"  ❌ {os.path.basename(csv_file)}: Error - {str(e)}")
+
+    if out:
+        sys.stdout.write("\n".join(out) + "\n")
 
 def verify_project_files():
     """Verify all project files are present"""
@@ -121,18 +197,19 @@ def verify_project_files():
     
     print("Core Documentation:")
     for file in required_files:
-        if os.path.exists(file):
-            size = os.path.getsize(file)
+        # Single stat() answers both existence and size
+        try:
+            size = os.stat(file).st_size
             print(f"  ✅ {file}: {size:,} bytes")
-        else:
+        except OSError:
             print(f"  ❌ {file}: Missing")
-    
+
     print("\nMojo Implementations:")
     for file in mojo_files:
-        if os.path.exists(file):
-            size = os.path.getsize(file)
+        try:
+            size = os.stat(file).st_size
             print(f"  ✅ {file}: {size:,} bytes")
-        else:
+        except OSError:
             print(f"  ❌ {file}: Missing")
 
 def demonstrate_key_features():
@@ -161,27 +238,9 @@ def show_system_summary():
     print("\n📊 COMPLETE SYSTEM SUMMARY")
     print("=" * 35)
     
-    # Count files and directories
-    file_count = 0
-    dir_count = 0
-    total_size = 0
-    
-    for root, dirs, files in os.walk("."):
-        if "data" in root or "__pycache__" in root:
-            continue
-        dir_count += len(dirs)
-        for file in files:
-            if file.endswith(('.py', '.mojo', '.md')):
-                file_count += 1
-                total_size += os.path.getsize(os.path.join(root, file))
-    
-    data_file_count = 0
-    data_size = 0
-    
-    for root, dirs, files in os.walk("data"):
-        data_file_count += len(files)
-        for file in files:
-            data_size += os.path.getsize(os.path.join(root, file))
+    # Single fused traversal per tree: list, filter and stat in one pass
+    file_count, total_size = _scan_tree(".", suffixes=('.py', '.mojo', '.md'))
+    data_file_count, data_size = _scan_tree("data", skip=("__pycache__",))
     
     print("Implementation Files:")
     print(f"  • Python Files: {file_count}")
@@ -191,7 +250,9 @@ def show_system_summary():
     print("\nGenerated Data:")
     print(f"  • Data Files: {data_file_count}")
     print(f"  • Total Data Size: {data_size:,} bytes")
-    print(f"  • Data Directories: {len([d for d in os.listdir('data') if os.path.isdir(os.path.join('data', d))])}")
+    with os.scandir('data') as entries:
+        data_dir_count = sum(1 for entry in entries if entry.is_dir())
+    print(f"  • Data Directories: {data_dir_count}")
     
     print("\nKey Achievements:")
     print("  • Prime-Chaos Integration: ✅ Complete")
@@ -202,6 +263,8 @@ def show_system_summary():
 
 def main():
     """Main verification function"""
+    from datetime import datetime  # only used for the report banner
+
     print("🧬 COGNITIVE DESIGN FRAMEWORK - COMPLETE SYSTEM VERIFICATION")
     print("Prime Mathematics + Chaos Theory + Swarm Intelligence")
     print("=" * 65)
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Numerical kernels for the enhanced zeta function analysis
+Hot loops for the confidence-pair function C(s), JIT-compiled when Numba
+is available and falling back to interpreted loops otherwise
+"""
+
+import math
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:  # Numba is optional - kernels run interpreted
+    prange = range
+
+    def njit(*args, **kwargs):
+        def _decorate(fn):
+            return fn
+        return _decorate
+
+
+def _sieve(n):
+    """Primes up to n via a vectorized Eratosthenes sieve."""
+    flags = np.ones(n + 1, dtype=bool)
+    flags[:2] = False
+    for i in range(2, int(n ** 0.5) + 1):
+        if flags[i]:
+            flags[i*i::i] = False
+    return np.nonzero(flags)[0]
+
+
+# Sieved once at import (~1 ms for 10^5); p such that p+2 is also prime
+_PRIMES = _sieve(100_000)
+_TWIN_PRIMES = _PRIMES[:-1][np.diff(_PRIMES) == 2]
+
+
+@njit(cache=True, fastmath=True)
+def compute_enhanced_zeros(imags, confidence_shift):
+    """
+    Perturb standard zeros 1/2 + i*t along the real axis by
+    confidence_shift*sin(0.1*t). A C-speed loop under Numba, so the same
+    code handles the tabulated zero lists with millions of entries.
+    """
+    out = np.empty(imags.size, dtype=np.complex128)
+    for i in range(imags.size):
+        out[i] = complex(0.5 + confidence_shift * math.sin(imags[i] * 0.1), imags[i])
+    return out
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def confidence_pair_sum(s, primes, weights):
+    """
+    Twin-prime confidence pair function:
+    C(s) = sum_p weights(p) / |p^s - (p+2)^s|
+    parallelized across the s grid (each point is independent).
+    """
+    out = np.zeros_like(s)
+    for i in prange(s.size):
+        acc = 0.0
+        for k in range(primes.size):
+            p = primes[k]
+            acc += weights[k] / abs(p ** s[i] - (p + 2.0) ** s[i])
+        out[i] = acc
+    return out